@@ -1,5 +1,27 @@
-import json
+import asyncio
+import queue
+import re
 import socket
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+
+try:
+    # orjson is optional, it parses the answers a few times faster than the standard library.
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+    def json_loads(data):
+        return json.loads(bytes(data))
+
 
 # To be able to use it you need the MQL5 Service to send the data, it is possible to found it here:
 # -------------------------------------------------------------------- #
@@ -53,43 +75,567 @@ import socket
 #
 # -------------------------------------------------------------------- #
 
+# Every indicator answer fits in one read of this size, requests are much smaller.
+_RECEIVE_BUFFER_SIZE = 65536
+_SEND_BUFFER_SIZE = 16384
+
+# Header of a framed message: the payload size as a 4-byte big-endian unsigned integer.
+_FRAME_HEADER = struct.Struct("!I")
+
+# Most framed requests written back to back before reading their answers, past this the
+# latency of the last answer grows more than the saved system calls are worth.
+_MAX_BATCH = 100
+
+# Linux only, turns off delayed ACKs; the kernel resets it, so it is set again after each read.
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+# Most answers kept by the cache, the least recently used ones are dropped first.
+_CACHE_SIZE = 1024
+
+# A complete JSON string, its content may hold brackets that do not count.
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+# Position of start_position among the request arguments, after the symbol and the time frame
+# unless listed here.
+_START_POSITION_INDEX = {
+    "average_directional_index": 3,
+    "average_directional_index_wilder": 3,
+    "bollinger_bands": 3,
+    "macd": 5,
+    "moving_average": 3,
+    "stochastic": 5,
+}
+
+# Process-wide instances returned by Indicator.shared(), one per listening address and port.
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _encode(name, *args):
+    """
+    Encode the request message "<indicator name>,<arg>,<arg>,...".
+
+    Strategies repeat the same few calls on every tick, mostly with the default arguments,
+    so the encoded messages are memoized. ``typed`` keeps 2 and 2.0 apart, they are not
+    sent the same way. A miss formats every argument with one ``%``.
+    """
+    return ((name + ",%s" * len(args)) % args).encode("utf-8")
+
+
+def _is_complete(data):
+    """
+    Tell whether an unframed answer was fully received.
+
+    An answer holding a JSON object or array is complete once all its brackets are closed,
+    those inside strings left aside. Anything else is returned as it is, like a single read.
+    """
+    data = bytes(data).lstrip()
+    if data[:1] not in (b"{", b"["):
+        return True
+    data = _JSON_STRING.sub(b"", data)
+    if b'"' in data:
+        # The answer ends inside a string.
+        return False
+    return data.count(b"{") + data.count(b"[") <= data.count(b"}") + data.count(b"]")
+
+
+class _Connection:
+    """An accepted MQL5 connection with its own reusable send and receive buffers."""
+
+    def __init__(self, sock, framed):
+        self.sock = sock
+        self.framed = framed
+        # Set once an answer was received, a failure afterwards is likely just a stale connection.
+        self.used = False
+        self._buffer = bytearray(_RECEIVE_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._send_buffer = bytearray(256)
+        self._send_view = memoryview(self._send_buffer)
+
+    def send(self, payload):
+        if self.framed:
+            self.send_frames((payload,))
+        else:
+            self.sock.sendall(payload)
+
+    def send_frames(self, payloads):
+        """Write framed requests into the send buffer, headers included, and send them at once."""
+        size = sum(map(len, payloads)) + _FRAME_HEADER.size * len(payloads)
+        if size > len(self._send_buffer):
+            self._send_buffer = bytearray(size)
+            self._send_view = memoryview(self._send_buffer)
+
+        offset = 0
+        for payload in payloads:
+            _FRAME_HEADER.pack_into(self._send_buffer, offset, len(payload))
+            offset += _FRAME_HEADER.size
+            self._send_view[offset : offset + len(payload)] = payload
+            offset += len(payload)
+        self.sock.sendall(self._send_view[:size])
+
+    def receive(self):
+        """Read one answer, an empty result means the MQL5 side closed the connection."""
+        data = self._receive()
+        if _TCP_QUICKACK is not None and data:
+            self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        return data
+
+    def _receive(self):
+        if not self.framed:
+            return self._receive_unframed()
+
+        if not self._receive_exactly(_FRAME_HEADER.size):
+            return b""
+        (size,) = _FRAME_HEADER.unpack_from(self._buffer)
+        if size > len(self._buffer):
+            self._buffer = bytearray(size)
+            self._view = memoryview(self._buffer)
+        if not self._receive_exactly(size):
+            return b""
+        return self._view[:size]
+
+    def _receive_unframed(self):
+        """Read until the answer is complete, one read can end in the middle of a large answer."""
+        size = self.sock.recv_into(self._buffer)
+        while size and not _is_complete(self._view[:size]):
+            if size == len(self._buffer):
+                self._buffer = self._buffer + bytes(len(self._buffer))
+                self._view = memoryview(self._buffer)
+            count = self.sock.recv_into(self._view[size:])
+            if not count:
+                break
+            size += count
+        return self._view[:size]
+
+    def _receive_exactly(self, size):
+        received = 0
+        while received < size:
+            count = self.sock.recv_into(self._view[received:size])
+            if not count:
+                return False
+            received += count
+        return True
+
+    def close(self):
+        self.sock.close()
+
 
 class Indicator:
-    def __init__(self, address="localhost", port=9090, listen=1):
+    def __init__(
+        self,
+        address="localhost",
+        port=9090,
+        listen=1,
+        pool_size=None,
+        framed=False,
+        cache_ttl=0.0,
+        cache_per_bar=False,
+        retries=3,
+        reuse_port=False,
+    ):
         self.address = address
         self.port = port
         self.listen = listen
         self.location = (address, port)
 
-        self.s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.s.bind((self.address, self.port))
-        self.s.listen(self.listen)
+        # Framed mode prefixes every message with its size. The published MQL5 Service only speaks
+        # the unframed protocol, framed=True needs a modified Service that does not exist yet.
+        self.framed = framed
 
-    # -------------------------------------------------------------------- #
+        self.s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
-    def accelerator_oscillator(
-        self, symbol, time_frame=1, start_position=0
-    ):  # Change it if you want past values, zero is the most recent.
-        try:
-            client_socket, address = self.s.accept()
-            message = f"accelerator_oscillator," f"{symbol}," f"{time_frame}," f"{start_position}"
+        # Several strategy processes can listen on the same port, the kernel then spreads the
+        # MQL5 connections over them.
+        self.reuse_port = reuse_port
+        if self.reuse_port:
+            if not hasattr(socket, "SO_REUSEPORT"):
+                raise ValueError("reuse_port needs a platform with SO_REUSEPORT.")
+            self.s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
+        self.s.bind(self.location)
+        self.s.listen(self.listen)
 
-            result = data.decode("utf-8")
+        # The accepted connection is kept and reused by the following calls, one at a time.
+        self._conn = None
+        self._conn_lock = threading.RLock()
+
+        # Requests collected inside a ``with self.batch():`` block, each thread has its own.
+        self._local = threading.local()
+
+        # Answers are reused for cache_ttl seconds when the same request is repeated,
+        # keep it shorter than the tick period. Zero disables the cache.
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # With cache_per_bar an answer about a closed bar (start_position 1 or more) is reused
+        # until a new bar opens on its symbol and time frame. The open time of the current bar is
+        # looked up in the MetaTrader 5 terminal for each such request, which is much cheaper than
+        # the MQL5 round trip. The still forming bar (start_position 0) is always asked for.
+        self.cache_per_bar = cache_per_bar
+        if self.cache_per_bar:
+            import MetaTrader5 as Mt5
+
+            self._copy_rates_from_pos = Mt5.copy_rates_from_pos
+
+        # A request failing on a fresh connection is tried again up to ``retries`` times. No delay
+        # is needed in between, each new attempt waits in accept() until the MQL5 Service connects.
+        self.retries = retries
+
+        # Pooled mode: a background thread accepts the MQL5 feeders as they connect and
+        # keeps them in a queue, so several symbols can share this single listening socket.
+        # At most pool_size connections are open at once, a discarded one frees its slot.
+        self.pool_size = pool_size
+        self._pool = None
+        if self.pool_size:
+            self.s.listen(max(self.listen, self.pool_size))
+            self._pool = queue.SimpleQueue()
+            self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+            self._acceptor = threading.Thread(target=self._accept_loop, daemon=True)
+            self._acceptor.start()
+
+    def _accept(self):
+        """Accept one MQL5 connection, tuned for small request/response messages."""
+        client_socket, address = self.s.accept()
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # The connection is kept between calls, let the kernel notice a terminal that vanished.
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, size in ((socket.SO_RCVBUF, _RECEIVE_BUFFER_SIZE), (socket.SO_SNDBUF, _SEND_BUFFER_SIZE)):
+            # Only grow the kernel buffers, the system default may already be larger.
+            if client_socket.getsockopt(socket.SOL_SOCKET, option) < size:
+                client_socket.setsockopt(socket.SOL_SOCKET, option, size)
+        return _Connection(client_socket, self.framed)
+
+    def _accept_loop(self):
+        """Accept MQL5 connections forever and hand them to the pool."""
+        while True:
+            self._pool_slots.acquire()
             try:
-                return json.loads(result)
-
-            except ValueError:
+                connection = self._accept()
+            except OSError:
+                # The listening socket was closed.
+                return
+            self._pool.put(connection)
+
+    def _acquire(self):
+        """Get a connection, from the pool or the one kept from a previous call."""
+        if self._pool is not None:
+            return self._pool.get()
+        self._conn_lock.acquire()
+        if self._conn is None:
+            try:
+                self._conn = self._accept()
+            except BaseException:
+                self._conn_lock.release()
+                raise
+        return self._conn
+
+    def _release(self, connection):
+        """Give a healthy connection back to the pool; the kept connection stays open."""
+        if self._pool is not None:
+            self._pool.put(connection)
+        else:
+            self._conn_lock.release()
+
+    def _discard(self, connection):
+        """Close a broken connection so the next call gets a new one."""
+        connection.close()
+        if self._pool is not None:
+            self._pool_slots.release()
+        else:
+            self._conn = None
+            self._conn_lock.release()
+
+    @classmethod
+    def shared(cls, address="localhost", port=9090, **kwargs):
+        """
+        Return the process-wide Indicator listening on ``address`` and ``port``.
+
+        Strategy modules that each need indicators can share one listening socket and one MQL5
+        connection instead of each binding its own. The keyword arguments are only used when
+        the instance is created by the first call.
+        """
+        with _SHARED_LOCK:
+            indicator = _SHARED.get((address, port))
+            if indicator is None:
+                indicator = _SHARED[(address, port)] = cls(address, port, **kwargs)
+            return indicator
+
+    @contextmanager
+    def reserve(self):
+        """
+        Keep the MQL5 connection for the calling thread during the block.
+
+        The indicator calls made inside the block are not interleaved with calls from other
+        threads. With a connection pool every call already has a connection of its own.
+        """
+        with self._conn_lock:
+            yield self
+
+    async def async_call(self, name, *args, **kwargs):
+        """
+        Run the indicator method ``name`` without blocking the event loop.
+
+        Independent indicators can be awaited together, with a connection pool their round
+        trips overlap.
+
+        Example:
+            macd, rsi = await asyncio.gather(
+                indicator.async_call("macd", "EURUSD"),
+                indicator.async_call("relative_strength_index", "EURUSD"),
+            )
+        """
+        method = getattr(self, name)
+        return await asyncio.get_running_loop().run_in_executor(None, partial(method, *args, **kwargs))
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect the indicator calls made inside the block and send them together on exit.
+
+        Inside the block every indicator method returns a ``concurrent.futures.Future``
+        instead of the result. When a connection pool is used the requests are spread over
+        the pooled connections, in framed mode without a pool they are all written at once
+        to the kept connection (framed mode needs a modified MQL5 Service that does not exist
+        yet). Either way the whole batch costs about one round trip. With the default unframed
+        connection and no pool the requests are sent one after another, N calls still cost N
+        round trips and the block only changes the results into futures.
+        Only the calls made by the thread that opened the block are collected.
+
+        Example:
+            with indicator.batch():
+                macd = indicator.macd("EURUSD")
+                rsi = indicator.relative_strength_index("EURUSD")
+            print(macd.result(), rsi.result())
+        """
+        if getattr(self._local, "batch", None) is not None:
+            # Nested block, the outer one sends everything.
+            yield
+            return
+
+        self._local.batch = []
+        try:
+            yield
+        except BaseException:
+            for payload, bar, future in self._local.batch:
+                future.cancel()
+            raise
+        finally:
+            pending, self._local.batch = self._local.batch, None
+
+        self._send_batch(pending)
+
+    def call_many(self, requests):
+        """
+        Run several indicator calls as one batch and return their results in order.
+
+        Like batch(), this only saves round trips with a connection pool or in framed mode, with
+        the default connection the calls are made one after another.
+
+        Args:
+            requests: Iterable of ``(method_name, args)`` or ``(method_name, args, kwargs)`` tuples,
+                e.g. ``[("macd", ("EURUSD",)), ("momentum", ("EURUSD",), {"mom_period": 10})]``.
+
+        Returns:
+            list: The results, in the order of ``requests``; None for a call that got no answer.
+        """
+        if getattr(self._local, "batch", None) is not None:
+            raise RuntimeError("call_many() cannot be used inside a batch() block")
+
+        with self.batch():
+            futures = [getattr(self, spec[0])(*spec[1], **(spec[2] if len(spec) > 2 else {})) for spec in requests]
+        return [future.result() for future in futures]
+
+    def _send_batch(self, pending):
+        """Send the collected requests and fill their futures with the answers."""
+        pending = [item for item in pending if item[2].set_running_or_notify_cancel()]
+
+        if self.framed and self._pool is None and len(pending) > 1:
+            pending = [
+                item
+                for start in range(0, len(pending), _MAX_BATCH)
+                for item in self._pipeline(pending[start : start + _MAX_BATCH])
+            ]
+
+        def fulfil(item):
+            payload, bar, future = item
+            try:
+                future.set_result(self._call(payload, bar))
+            except Exception as error:
+                future.set_exception(error)
+
+        if self._pool is not None and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.pool_size, len(pending))) as executor:
+                list(executor.map(fulfil, pending))
+        else:
+            for item in pending:
+                fulfil(item)
+
+    def _pipeline(self, pending):
+        """
+        Write the framed requests back to back on the kept connection, then read the answers.
+
+        The MQL5 Service answers in order, so no request id is needed to match them. Returns the
+        requests left without an answer, to be sent again one by one.
+        """
+        queued = []
+        for payload, bar, future in pending:
+            result = self._cached(payload, bar)
+            if result is None:
+                queued.append((payload, bar, future))
+            else:
+                future.set_result(result)
+        if len(queued) < 2:
+            return queued
+
+        connection = self._acquire()
+        answered = 0
+        try:
+            connection.send_frames([payload for payload, bar, future in queued])
+            for payload, bar, future in queued:
+                data = connection.receive()
+                if not data:
+                    break
+                result = json_loads(data)
+                self._remember(payload, bar, data)
+                future.set_result(result)
+                answered += 1
+
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, ValueError):
+            pass
+
+        except BaseException:
+            self._discard(connection)
+            raise
+
+        if answered < len(queued):
+            self._discard(connection)
+            return queued[answered:]
+
+        connection.used = True
+        self._release(connection)
+        return []
+
+    def _request(self, name, *args):
+        """Ask the MQL5 Service for the indicator ``name`` computed with ``args``."""
+        payload = _encode(name, *args)
+        # Every indicator request starts with the symbol and the time frame.
+        if self.cache_per_bar and args[_START_POSITION_INDEX.get(name, 2)] >= 1:
+            bar = self._bar_time(args[0], args[1])
+        else:
+            bar = None
+
+        pending = getattr(self._local, "batch", None)
+        if pending is not None:
+            future = Future()
+            pending.append((payload, bar, future))
+            return future
+        return self._call(payload, bar)
+
+    def clear_cache(self):
+        """Forget the cached answers, e.g. when a new tick arrives."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _bar_time(self, symbol, time_frame):
+        """Return the open time of the current bar, None when the terminal does not have it."""
+        rates = self._copy_rates_from_pos(symbol, time_frame, 0, 1)
+        return int(rates["time"][0]) if rates is not None and len(rates) else None
+
+    def _cache_enabled(self, bar):
+        return self.cache_ttl or (self.cache_per_bar and bar is not None)
+
+    def _cached(self, payload, bar=None):
+        """
+        Return the cached answer to an encoded request while it is fresh, otherwise None.
+
+        The raw answer is kept and decoded again on every hit, so a caller changing the returned
+        list or dict does not change what the next caller gets.
+        """
+        if not self._cache_enabled(bar):
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(payload)
+            if cached is None:
+                return None
+            stamp, cached_bar, data = cached
+            if cached_bar != bar or (self.cache_ttl and time.monotonic() - stamp >= self.cache_ttl):
+                return None
+            self._cache.move_to_end(payload)
+        return json_loads(data)
+
+    def _remember(self, payload, bar, data):
+        """Cache the raw bytes of a successfully decoded answer when the cache is enabled."""
+        if not self._cache_enabled(bar):
+            return
+        # The answer may still be a view of the connection buffer, which the next read overwrites.
+        data = bytes(data)
+        with self._cache_lock:
+            self._cache[payload] = (time.monotonic(), bar, data)
+            self._cache.move_to_end(payload)
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _call(self, payload, bar=None):
+        """Return the answer to an encoded request, from the cache when it is still fresh."""
+        result = self._cached(payload, bar)
+        if result is None:
+            result = self._exchange(payload, bar)
+        return result
+
+    def _exchange(self, payload, bar=None):
+        """Send one encoded indicator request to the MQL5 Service and return the decoded answer."""
+        stale = 0
+        failures = 0
+        while True:
+            connection = self._acquire()
+            try:
+                connection.send(payload)
+                data = connection.receive()
+
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                data = None
+
+            except BaseException:
+                self._discard(connection)
+                raise
+
+            if data:
+                try:
+                    result = json_loads(data)
+
+                except ValueError:
+                    print("Connection lost to MQL5 Service")
+                    self._discard(connection)
+                    return None
+
+                self._remember(payload, bar, data)
+                connection.used = True
+                self._release(connection)
+                return result
+
+            self._discard(connection)
+
+            # A reused connection may have been closed by the MQL5 side since the last call,
+            # the request is then sent again right away over a fresh one. The pool can hold
+            # up to pool_size of those stale connections.
+            if connection.used and stale < (self.pool_size or 1):
+                stale += 1
+                continue
+
+            # A fresh connection failing means the MQL5 Service itself is restarting or gone.
+            failures += 1
+            if failures > self.retries:
                 print("Connection lost to MQL5 Service")
-                pass
+                return None
 
-        except ConnectionResetError:
-            pass
+    # -------------------------------------------------------------------- #
 
-        except ConnectionAbortedError:
-            pass
+    def accelerator_oscillator(
+        self, symbol, time_frame=1, start_position=0
+    ):  # Change it if you want past values, zero is the most recent.
+        return self._request("accelerator_oscillator", symbol, time_frame, start_position)
 
     # -------------------------------------------------------------------- #
 
@@ -103,28 +649,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"accumulation_distribution," f"{symbol}," f"{time_frame}," f"{start_position}," f"{applied_volume}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("accumulation_distribution", symbol, time_frame, start_position, applied_volume)
 
     # -------------------------------------------------------------------- #
 
@@ -146,35 +671,16 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=4,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"adaptive_moving_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ama_period},"
-                f"{fast_ma_period},"
-                f"{slow_ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "adaptive_moving_average",
+            symbol,
+            time_frame,
+            start_position,
+            ama_period,
+            fast_ma_period,
+            slow_ma_period,
+            applied_price,
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -202,62 +708,24 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=4,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"alligator,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{jaw_period},"
-                f"{teeth_period},"
-                f"{lips_period},"
-                f"{ma_method},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "alligator",
+            symbol,
+            time_frame,
+            start_position,
+            jaw_period,
+            teeth_period,
+            lips_period,
+            ma_method,
+            applied_price,
+        )
 
     # -------------------------------------------------------------------- #
 
     def average_directional_index(
         self, symbol, time_frame=1, period=14, start_position=0
     ):  # Change it if you want past values, zero is the most recent.
-        try:
-            client_socket, address = self.s.accept()
-            message = f"average_directional_index," f"{symbol}," f"{time_frame}," f"{period}," f"{start_position}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("average_directional_index", symbol, time_frame, period, start_position)
 
         # -------------------------------------------------------------------- #
 
@@ -266,28 +734,7 @@ class Indicator:
     ):  # Change it if you want past values, zero is the most
         # recent.
 
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"average_directional_index_wilder," f"{symbol}," f"{time_frame}," f"{period}," f"{start_position}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("average_directional_index_wilder", symbol, time_frame, period, start_position)
 
     # -------------------------------------------------------------------- #
 
@@ -298,52 +745,14 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         ma_period=14,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"average_true_range," f"{symbol}," f"{time_frame}," f"{start_position}," f"{ma_period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("average_true_range", symbol, time_frame, start_position, ma_period)
 
     # -------------------------------------------------------------------- #
 
     def awesome_oscillator(
         self, symbol, time_frame=1, start_position=0
     ):  # Change it if you want past values, zero is the most recent.
-        try:
-            client_socket, address = self.s.accept()
-            message = f"awesome_oscillator," f"{symbol}," f"{time_frame}," f"{start_position}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("awesome_oscillator", symbol, time_frame, start_position)
 
     # -------------------------------------------------------------------- #
     # Free
@@ -365,35 +774,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"bollinger_bands,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{period},"
-                f"{start_position},"
-                f"{ma_shift},"
-                f"{deviation},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "bollinger_bands", symbol, time_frame, period, start_position, ma_shift, deviation, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -404,26 +787,7 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         ma_period=13,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"bears_power," f"{symbol}," f"{time_frame}," f"{start_position}," f"{ma_period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("bears_power", symbol, time_frame, start_position, ma_period)
 
     # -------------------------------------------------------------------- #
 
@@ -434,26 +798,7 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         ma_period=13,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"bulls_power," f"{symbol}," f"{time_frame}," f"{start_position}," f"{ma_period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("bulls_power", symbol, time_frame, start_position, ma_period)
 
     # -------------------------------------------------------------------- #
 
@@ -475,35 +820,16 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"chaikin_oscillator,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{fast_ma_period},"
-                f"{slow_ma_period},"
-                f"{ma_method},"
-                f"{applied_volume}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "chaikin_oscillator",
+            symbol,
+            time_frame,
+            start_position,
+            fast_ma_period,
+            slow_ma_period,
+            ma_method,
+            applied_volume,
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -524,33 +850,7 @@ class Indicator:
         # 7 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"commodity_channel_index,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("commodity_channel_index", symbol, time_frame, start_position, ma_period, applied_price)
 
         # -------------------------------------------------------------------- #
 
@@ -561,26 +861,7 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         period=14,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"demarker," f"{symbol}," f"{time_frame}," f"{start_position}," f"{period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("demarker", symbol, time_frame, start_position, period)
 
     # -------------------------------------------------------------------- #
 
@@ -601,33 +882,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"double_exponential_moving_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "double_exponential_moving_average", symbol, time_frame, start_position, ma_period, applied_price
+        )
 
         # -------------------------------------------------------------------- #
 
@@ -655,35 +912,9 @@ class Indicator:
         applied_price=1,
         deviation=0.100,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"envelopes,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{ma_method},"
-                f"{applied_price},"
-                f"{deviation}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "envelopes", symbol, time_frame, start_position, ma_period, ma_method, applied_price, deviation
+        )
 
     def force_index(
         self,
@@ -702,34 +933,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"force_index,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{ma_method},"
-                f"{applied_volume}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("force_index", symbol, time_frame, start_position, ma_period, ma_method, applied_volume)
 
         # -------------------------------------------------------------------- #
 
@@ -749,59 +953,16 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"fractal_adaptive_moving_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "fractal_adaptive_moving_average", symbol, time_frame, start_position, ma_period, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
     def fractals(
         self, symbol, time_frame=1, start_position=0
     ):  # Change it if you want past values, zero is the most recent.
-        try:
-            client_socket, address = self.s.accept()
-            message = f"fractals," f"{symbol}," f"{time_frame}," f"{start_position}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("fractals", symbol, time_frame, start_position)
 
     # -------------------------------------------------------------------- #
     # https://www.mql5.com/en/forum/41357
@@ -832,39 +993,20 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=4,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"gator_oscillator,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{jaw_period},"
-                f"{jaw_shift},"
-                f"{teeth_period},"
-                f"{teeth_shift},"
-                f"{lips_period},"
-                f"{lips_shift},"
-                f"{ma_method},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "gator_oscillator",
+            symbol,
+            time_frame,
+            start_position,
+            jaw_period,
+            jaw_shift,
+            teeth_period,
+            teeth_shift,
+            lips_period,
+            lips_shift,
+            ma_method,
+            applied_price,
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -877,34 +1019,9 @@ class Indicator:
         kijun_sen=26,
         senkou_span_b=52,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"ichimoku_kinko_hyo,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{tenkan_sen},"
-                f"{kijun_sen},"
-                f"{senkou_span_b}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "ichimoku_kinko_hyo", symbol, time_frame, start_position, tenkan_sen, kijun_sen, senkou_span_b
+        )
 
     # -------------------------------------------------------------------- #
     # Free
@@ -926,35 +1043,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"macd,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{fast_ema_period},"
-                f"{slow_ema_period},"
-                f"{signal_period},"
-                f"{start_position},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "macd", symbol, time_frame, fast_ema_period, slow_ema_period, signal_period, start_position, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -968,28 +1059,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"market_facilitation_index," f"{symbol}," f"{time_frame}," f"{start_position}," f"{applied_volume}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("market_facilitation_index", symbol, time_frame, start_position, applied_volume)
 
     # -------------------------------------------------------------------- #
 
@@ -1009,28 +1079,7 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"momentum," f"{symbol}," f"{time_frame}," f"{start_position}," f"{mom_period}," f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("momentum", symbol, time_frame, start_position, mom_period, applied_price)
 
     # -------------------------------------------------------------------- #
 
@@ -1045,33 +1094,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"money_flow_index,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_volume}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("money_flow_index", symbol, time_frame, start_position, ma_period, applied_volume)
 
     # -------------------------------------------------------------------- #
     # Free
@@ -1097,34 +1120,7 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"moving_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{period},"
-                f"{start_position},"
-                f"{method},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("moving_average", symbol, time_frame, period, start_position, method, applied_price)
 
     # -------------------------------------------------------------------- #
 
@@ -1146,35 +1142,16 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"moving_average_of_oscillator,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{fast_ema_period},"
-                f"{slow_ema_period},"
-                f"{macd_sma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "moving_average_of_oscillator",
+            symbol,
+            time_frame,
+            start_position,
+            fast_ema_period,
+            slow_ema_period,
+            macd_sma_period,
+            applied_price,
+        )
 
     # -------------------------------------------------------------------- #
     # Free
@@ -1188,26 +1165,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"obv," f"{symbol}," f"{time_frame}," f"{start_position}," f"{applied_volume}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("obv", symbol, time_frame, start_position, applied_volume)
 
     # -------------------------------------------------------------------- #
 
@@ -1219,26 +1177,7 @@ class Indicator:
         step=0.02,
         maximum=0.2,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"parabolic_sar," f"{symbol}," f"{time_frame}," f"{start_position}," f"{step}," f"{maximum}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("parabolic_sar", symbol, time_frame, start_position, step, maximum)
 
     # -------------------------------------------------------------------- #
 
@@ -1258,33 +1197,7 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"relative_strength_index,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("relative_strength_index", symbol, time_frame, start_position, ma_period, applied_price)
 
     # -------------------------------------------------------------------- #
 
@@ -1295,26 +1208,7 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         ma_period=10,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"relative_vigor_index," f"{symbol}," f"{time_frame}," f"{start_position}," f"{ma_period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("relative_vigor_index", symbol, time_frame, start_position, ma_period)
 
     # -------------------------------------------------------------------- #
 
@@ -1340,34 +1234,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"standard_deviation,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{ma_method},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "standard_deviation", symbol, time_frame, start_position, ma_period, ma_method, applied_price
+        )
 
     # -------------------------------------------------------------------- #
     # Free
@@ -1390,36 +1259,9 @@ class Indicator:
         # 1 - STO_CLOSECLOSE
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"stochastic,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{k_period},"
-                f"{d_period},"
-                f"{slowing},"
-                f"{start_position},"
-                f"{method},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "stochastic", symbol, time_frame, k_period, d_period, slowing, start_position, method, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -1440,33 +1282,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"triple_exponential_ma_oscillator,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "triple_exponential_ma_oscillator", symbol, time_frame, start_position, ma_period, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -1487,33 +1305,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"triple_exponential_moving_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{ma_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "triple_exponential_moving_average", symbol, time_frame, start_position, ma_period, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -1534,34 +1328,9 @@ class Indicator:
         # 6 - PRICE_WEIGHTED
         applied_price=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = (
-                f"variable_index_dynamic_average,"
-                f"{symbol},"
-                f"{time_frame},"
-                f"{start_position},"
-                f"{cmo_period},"
-                f"{ema_period},"
-                f"{applied_price}"
-            )
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request(
+            "variable_index_dynamic_average", symbol, time_frame, start_position, cmo_period, ema_period, applied_price
+        )
 
     # -------------------------------------------------------------------- #
 
@@ -1575,26 +1344,7 @@ class Indicator:
         # 1 - VOLUME_REAL
         applied_volume=0,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"volumes," f"{symbol}," f"{time_frame}," f"{start_position}," f"{applied_volume}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("volumes", symbol, time_frame, start_position, applied_volume)
 
     # -------------------------------------------------------------------- #
 
@@ -1605,23 +1355,4 @@ class Indicator:
         start_position=0,  # Change it if you want past values, zero is the most recent.
         calc_period=14,
     ):
-        try:
-            client_socket, address = self.s.accept()
-            message = f"williams_percent_range," f"{symbol}," f"{time_frame}," f"{start_position}," f"{calc_period}"
-
-            client_socket.send(bytes(message, "utf-8"))
-            data = client_socket.recv(1024)
-
-            result = data.decode("utf-8")
-            try:
-                return json.loads(result)
-
-            except ValueError:
-                print("Connection lost to MQL5 Service")
-                pass
-
-        except ConnectionResetError:
-            pass
-
-        except ConnectionAbortedError:
-            pass
+        return self._request("williams_percent_range", symbol, time_frame, start_position, calc_period)
@@ -1,6 +1,5 @@
-from typing import List, Union
-
 import MetaTrader5 as Mt5
+import numpy as np
 
 
 class Rates:
@@ -20,61 +19,56 @@ class Rates:
             None
         """
         self._symbol = symbol
-        try:
-            rates_data = Mt5.copy_rates_from_pos(self._symbol, time_frame, start_pos, period)
-
-            self._time = rates_data["time"]
-            self._open = rates_data["open"]
-            self._high = rates_data["high"]
-            self._low = rates_data["low"]
-            self._close = rates_data["close"]
-            self._tick_volume = rates_data["tick_volume"]
-            self._spread = rates_data["spread"]
-            self._real_volume = rates_data["real_volume"]
-
-            # Optionally, you can print statements here for debugging
-            # print(f"Rates object created for symbol: {self._symbol}")
-        except Exception as e:
-            # Optionally, you can print statements here for debugging
-            # print(f"Failed to create Rates object for symbol {self._symbol}. Error: {e}")
-            raise
+        # The columns are views into the structured array returned by MetaTrader 5, not copies.
+        rates_data = Mt5.copy_rates_from_pos(self._symbol, time_frame, start_pos, period)
+        if rates_data is None:
+            raise ValueError(f"Failed to get rates for {self._symbol}: {Mt5.last_error()}")
+
+        self._time = rates_data["time"]
+        self._open = rates_data["open"]
+        self._high = rates_data["high"]
+        self._low = rates_data["low"]
+        self._close = rates_data["close"]
+        self._tick_volume = rates_data["tick_volume"]
+        self._spread = rates_data["spread"]
+        self._real_volume = rates_data["real_volume"]
 
     @property
-    def time(self) -> List[Union[int, float]]:
-        """List of timestamps."""
+    def time(self) -> np.ndarray:
+        """Array of timestamps."""
         return self._time
 
     @property
-    def open(self) -> List[float]:
-        """List of open prices."""
+    def open(self) -> np.ndarray:
+        """Array of open prices."""
         return self._open
 
     @property
-    def high(self) -> List[float]:
-        """List of high prices."""
+    def high(self) -> np.ndarray:
+        """Array of high prices."""
         return self._high
 
     @property
-    def low(self) -> List[float]:
-        """List of low prices."""
+    def low(self) -> np.ndarray:
+        """Array of low prices."""
         return self._low
 
     @property
-    def close(self) -> List[float]:
-        """List of close prices."""
+    def close(self) -> np.ndarray:
+        """Array of close prices."""
         return self._close
 
     @property
-    def tick_volume(self) -> List[int]:
-        """List of tick volumes."""
+    def tick_volume(self) -> np.ndarray:
+        """Array of tick volumes."""
         return self._tick_volume
 
     @property
-    def spread(self) -> List[int]:
-        """List of spreads."""
+    def spread(self) -> np.ndarray:
+        """Array of spreads."""
         return self._spread
 
     @property
-    def real_volume(self) -> List[int]:
-        """List of real volumes."""
+    def real_volume(self) -> np.ndarray:
+        """Array of real volumes."""
         return self._real_volume
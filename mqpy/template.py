@@ -1,20 +1,8 @@
 import argparse
+from pathlib import Path
 
-
-def get_arguments():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--file_name", type=str, action="store", default="demo")
-    parser.add_argument("--symbol", type=str, action="store", default="EURUSD")
-    return vars(parser.parse_args())
-
-
-def main():
-    file_name = get_arguments()["file_name"]
-    symbol = get_arguments()["symbol"]
-
-    with open(f"{file_name}.py", "w") as file:
-        file.write(
-            f"""from mqpy.rates import Rates
+# The generated strategy, filled with str.format_map; literal braces must be doubled.
+_TEMPLATE = """from mqpy.rates import Rates
 from mqpy.tick import Tick
 from mqpy.trade import Trade
 
@@ -48,8 +36,8 @@ while True:
     # Check for new tick
     if current_tick.time_msc != prev_tick_time:
         # Calculate moving averages
-        short_ma = sum(historical_rates.close[-short_window_size:]) / short_window_size
-        long_ma = sum(historical_rates.close[-long_window_size:]) / long_window_size
+        short_ma = historical_rates.close[-short_window_size:].sum() / short_window_size
+        long_ma = historical_rates.close[-long_window_size:].sum() / long_window_size
 
         # Generate signals based on moving average crossover
         is_cross_above = short_ma > long_ma and current_tick.last > short_ma
@@ -68,4 +56,16 @@ while True:
 print("Finishing the program.")
 print("Program finished.")
 """
-        )
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file_name", type=str, action="store", default="demo")
+    parser.add_argument("--symbol", type=str, action="store", default="EURUSD")
+    return vars(parser.parse_args())
+
+
+def main():
+    args = get_arguments()
+
+    Path(f"{args['file_name']}.py").write_bytes(_TEMPLATE.format_map(args).encode("utf-8"))
@@ -4,7 +4,26 @@ import MetaTrader5 as Mt5
 
 
 class Tick:
-    """Represents real-time tick data for a financial instrument."""
+    """
+    Represents real-time tick data for a financial instrument.
+
+    Attributes:
+        symbol (str): The financial instrument symbol.
+        time (int): Timestamp of the tick data.
+        bid (float): Current bid price.
+        ask (float): Current ask price.
+        last (float): Last traded price.
+        volume (int): Tick volume.
+        time_msc (int): Timestamp in milliseconds.
+        flags (int): Flags indicating tick data attributes.
+        volume_real (Optional[float]): Real volume (if available).
+    """
+
+    # Read on every loop iteration, plain slot attributes avoid a property call per read.
+    __slots__ = ("symbol", "time", "bid", "ask", "last", "volume", "time_msc", "flags", "volume_real")
+
+    # Resolved once here instead of on the MetaTrader5 module for every new tick.
+    _symbol_info_tick = staticmethod(Mt5.symbol_info_tick)
 
     def __init__(self, symbol: str) -> None:
         """
@@ -16,59 +35,14 @@ class Tick:
         Returns:
             None
         """
-        tick_info = Mt5.symbol_info_tick(symbol)
-
-        self._symbol = symbol
-        self._time = tick_info.time
-        self._bid = tick_info.bid
-        self._ask = tick_info.ask
-        self._last = tick_info.last
-        self._volume = tick_info.volume
-        self._time_msc = tick_info.time_msc
-        self._flags = tick_info.flags
-        self._volume_real = tick_info.volume_real
-
-    @property
-    def symbol(self) -> str:
-        """The financial instrument symbol."""
-        return self._symbol
-
-    @property
-    def time(self) -> int:
-        """Timestamp of the tick data."""
-        return self._time
-
-    @property
-    def bid(self) -> float:
-        """Current bid price."""
-        return self._bid
-
-    @property
-    def ask(self) -> float:
-        """Current ask price."""
-        return self._ask
-
-    @property
-    def last(self) -> float:
-        """Last traded price."""
-        return self._last
-
-    @property
-    def volume(self) -> int:
-        """Tick volume."""
-        return self._volume
-
-    @property
-    def time_msc(self) -> int:
-        """Timestamp in milliseconds."""
-        return self._time_msc
-
-    @property
-    def flags(self) -> int:
-        """Flags indicating tick data attributes."""
-        return self._flags
-
-    @property
-    def volume_real(self) -> Optional[float]:
-        """Real volume (if available)."""
-        return self._volume_real
+        tick_info = Tick._symbol_info_tick(symbol)
+
+        self.symbol: str = symbol
+        self.time: int = tick_info.time
+        self.bid: float = tick_info.bid
+        self.ask: float = tick_info.ask
+        self.last: float = tick_info.last
+        self.volume: int = tick_info.volume
+        self.time_msc: int = tick_info.time_msc
+        self.flags: int = tick_info.flags
+        self.volume_real: Optional[float] = tick_info.volume_real
@@ -1,4 +1,6 @@
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 
 import MetaTrader5 as Mt5
 
@@ -57,6 +59,13 @@ class Trade:
         self.start_time_hour, self.start_time_minutes = start_time.split(":")
         self.finishing_time_hour, self.finishing_time_minutes = finishing_time.split(":")
         self.ending_time_hour, self.ending_time_minutes = ending_time.split(":")
+        # Parsed once into hour * 100 + minute, the strings above are kept for the summary.
+        self._start_hm: int = int(self.start_time_hour) * 100 + int(self.start_time_minutes)
+        self._finish_hm: int = int(self.finishing_time_hour) * 100 + int(self.finishing_time_minutes)
+        self._end_hm: int = int(self.ending_time_hour) * 100 + int(self.ending_time_minutes)
+        # The local time as hour * 100 + minute, and the minute since the epoch it was read in.
+        self._clock_minute: int = -1
+        self._clock_hm: int = 0
         self.fee: float = fee
 
         self.loss_deals: int = 0
@@ -66,11 +75,19 @@ class Trade:
 
         self.ticket: int = 0
 
+        # Fields of the market order requests that are the same for every order. The symbol, magic
+        # number and lot are public attributes a caller may change, they are read for each order.
+        self._order_template: dict = {
+            "action": Mt5.TRADE_ACTION_DEAL,
+            "deviation": 5,
+            "type_time": Mt5.ORDER_TIME_GTC,
+            "type_filling": Mt5.ORDER_FILLING_RETURN,
+        }
+
         print("\nInitializing the basics.")
         self.initialize()
         self.select_symbol()
         self.prepare_symbol()
-        self.sl_tp_steps: float = Mt5.symbol_info(self.symbol).trade_tick_size / Mt5.symbol_info(self.symbol).point
         print("Initialization successfully completed.")
 
         print()
@@ -125,6 +142,40 @@ class Trade:
                 print("Turned off")
                 quit()
 
+        self._keep_symbol_info(symbol_info)
+
+    def refresh_symbol_info(self) -> None:
+        """
+        Read the point, tick size and stop loss & take profit steps of the symbol again, e.g. after a contract rollover.
+
+        Returns:
+            None
+        """
+        self._keep_symbol_info(Mt5.symbol_info(self.symbol))
+
+    def _keep_symbol_info(self, symbol_info) -> None:
+        """
+        Keep the point and tick size of the symbol and the steps derived from them, they do not change during a session.
+
+        Args:
+            symbol_info (Mt5.SymbolInfo): The symbol information read from the terminal.
+
+        Returns:
+            None
+        """
+        self._point: float = symbol_info.point
+        self._tick_size: float = symbol_info.trade_tick_size
+        self.sl_tp_steps: float = self._tick_size / self._point
+
+    def _positions(self) -> Optional[tuple]:
+        """
+        Read the open positions of the symbol.
+
+        Returns:
+            Optional[tuple]: The open positions of the symbol, None when the terminal could not be read.
+        """
+        return Mt5.positions_get(symbol=self.symbol)
+
     def summary(self) -> None:
         """
         Print a summary of the expert advisor parameters.
@@ -175,28 +226,7 @@ class Trade:
         Returns:
             None
         """
-        point = Mt5.symbol_info(self.symbol).point
-        price = Mt5.symbol_info_tick(self.symbol).ask
-
-        self.ticket = Mt5.positions_get()[0].ticket if len(Mt5.positions_get()) == 1 else 0
-
-        request = {
-            "action": Mt5.TRADE_ACTION_DEAL,
-            "symbol": self.symbol,
-            "volume": self.lot,
-            "type": Mt5.ORDER_TYPE_BUY,
-            "price": price,
-            "sl": price - self.emergency_stop_loss * point,
-            "tp": price + self.emergency_take_profit * point,
-            "deviation": 5,
-            "magic": self.magic_number,
-            "comment": str(comment),
-            "type_time": Mt5.ORDER_TIME_GTC,
-            "type_filling": Mt5.ORDER_FILLING_RETURN,
-            "position": (Mt5.positions_get()[0].ticket if len(Mt5.positions_get()) == 1 else 0),
-        }
-        result = Mt5.order_send(request)
-        self.request_result(price, result)
+        self._send_order(True, comment)
 
     def open_sell_position(self, comment: str = "") -> None:
         """
@@ -208,25 +238,44 @@ class Trade:
         Returns:
             None
         """
-        point = Mt5.symbol_info(self.symbol).point
-        price = Mt5.symbol_info_tick(self.symbol).bid
+        self._send_order(False, comment)
 
-        self.ticket = Mt5.positions_get()[0].ticket if len(Mt5.positions_get()) == 1 else 0
+    def _send_order(self, buy: bool, comment: str = "", positions: Optional[tuple] = None) -> None:
+        """
+        Send a market order, closing the open position of the symbol if there is one.
+
+        Args:
+            buy (bool): True to buy at the ask price, False to sell at the bid price.
+            comment (str): A comment for the trade.
+            positions (Optional[tuple]): The open positions the caller has just read, read here when None.
+
+        Returns:
+            None
+        """
+        if positions is None:
+            positions = self._positions()
+        if positions is None:
+            # Without the open positions the order could open a new one instead of closing.
+            print(f"Order not sent: {self.symbol}, the open positions could not be read.")
+            return
+        self.ticket = positions[0].ticket if len(positions) == 1 else 0
+
+        tick = Mt5.symbol_info_tick(self.symbol)
+        price = tick.ask if buy else tick.bid
+        # The emergency stop loss is below the price for a buy and above it for a sell.
+        direction = 1 if buy else -1
 
         request = {
-            "action": Mt5.TRADE_ACTION_DEAL,
+            **self._order_template,
             "symbol": self.symbol,
+            "magic": self.magic_number,
             "volume": self.lot,
-            "type": Mt5.ORDER_TYPE_SELL,
+            "type": Mt5.ORDER_TYPE_BUY if buy else Mt5.ORDER_TYPE_SELL,
             "price": price,
-            "sl": price + self.emergency_stop_loss * point,
-            "tp": price - self.emergency_take_profit * point,
-            "deviation": 5,
-            "magic": self.magic_number,
+            "sl": price - direction * self.emergency_stop_loss * self._point,
+            "tp": price + direction * self.emergency_take_profit * self._point,
             "comment": str(comment),
-            "type_time": Mt5.ORDER_TIME_GTC,
-            "type_filling": Mt5.ORDER_FILLING_RETURN,
-            "position": (Mt5.positions_get()[0].ticket if len(Mt5.positions_get()) == 1 else 0),
+            "position": self.ticket,
         }
         result = Mt5.order_send(request)
         self.request_result(price, result)
@@ -249,8 +298,11 @@ class Trade:
 
         # Print the result
         if result.retcode == Mt5.TRADE_RETCODE_DONE:
-            if len(Mt5.positions_get(symbol=self.symbol)) == 1:
-                order_type = "Buy" if Mt5.positions_get(symbol=self.symbol)[0].type == 0 else "Sell"
+            positions = self._positions()
+            if positions is None:
+                print(f"Order done at {result.price}, the open positions could not be read.")
+            elif len(positions) == 1:
+                order_type = "Buy" if positions[0].type == 0 else "Sell"
                 print(order_type, "Position Opened:", result.price)
             else:
                 print(f"Position Closed: {result.price}")
@@ -267,13 +319,14 @@ class Trade:
         Returns:
             None
         """
-        if (len(Mt5.positions_get(symbol=self.symbol)) == 0) and self.trading_time():
-            if buy and not sell:
-                self.open_buy_position(comment)
-                self.total_deals += 1
-            if sell and not buy:
-                self.open_sell_position(comment)
-                self.total_deals += 1
+        # Exactly one of the signals must be set, both or neither mean there is nothing to open.
+        # The positions are only read when a signal fires, a position may have appeared since the last tick.
+        # A failed read (None) is not taken as "no positions", nothing is opened without knowing what is open.
+        positions = self._positions() if bool(buy) != bool(sell) and self.trading_time() else None
+        if positions is not None and not positions:
+            # The positions were just read, they are handed on instead of being read again.
+            self._send_order(bool(buy), comment, positions)
+            self.total_deals += 1
 
         self.stop_and_gain(comment)
 
@@ -294,12 +347,13 @@ class Trade:
             None
         """
         # buy (0) and sell(1)
-        if len(Mt5.positions_get(symbol=self.symbol)) == 1:
-            if Mt5.positions_get(symbol=self.symbol)[0].type == 0:  # if Buy
-                self.open_sell_position(comment)
+        positions = self._positions()
+        if positions is not None and len(positions) == 1:
+            if positions[0].type == 0:  # if Buy
+                self._send_order(False, comment, positions)
 
-            elif Mt5.positions_get(symbol=self.symbol)[0].type == 1:  # if Sell
-                self.open_buy_position(comment)
+            elif positions[0].type == 1:  # if Sell
+                self._send_order(True, comment, positions)
 
     def stop_and_gain(self, comment: str = "") -> None:
         """
@@ -311,47 +365,46 @@ class Trade:
         Returns:
             None
         """
-        if len(Mt5.positions_get()) == 1:
-            points = (
-                Mt5.positions_get()[0].profit
-                * Mt5.symbol_info(self.symbol).trade_tick_size
-                / Mt5.symbol_info(self.symbol).trade_tick_value
-            ) / Mt5.positions_get()[0].volume
-
-            if points / Mt5.symbol_info(self.symbol).point >= self.take_profit:
+        positions = self._positions()
+        if positions is not None and len(positions) == 1:
+            position = positions[0]
+            # Points gained by the position so far, the same as its profit converted back through
+            # the tick value and volume, without asking the terminal for the tick value.
+            points = (position.price_current - position.price_open) / self._point
+            if position.type == 1:  # if Sell
+                points = -points
+
+            if points >= self.take_profit:
                 self.profit_deals += 1
                 self.close_position(comment)
-                print(
-                    f"Take profit reached. ("
-                    f"{Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[-1].profit}"
-                    f")\n"
-                )
-                if (
-                    Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[-1].symbol
-                    == self.symbol
-                ):
-                    self.balance += Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[
-                        -1
-                    ].profit
+                last_deal = self._last_deal()
+                print(f"Take profit reached. ({last_deal.profit})\n")
+                if last_deal.symbol == self.symbol:
+                    self.balance += last_deal.profit
                 self.statistics()
 
-            elif ((points / Mt5.symbol_info(self.symbol).point) * -1) >= self.stop_loss:
+            elif -points >= self.stop_loss:
                 self.loss_deals += 1
                 self.close_position(comment)
-                print(
-                    f"Stop loss reached. ("
-                    f"{Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[-1].profit}"
-                    f")\n"
-                )
-                if (
-                    Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[-1].symbol
-                    == self.symbol
-                ):
-                    self.balance += Mt5.history_deals_get((datetime.today() - timedelta(days=1)), datetime.now())[
-                        -1
-                    ].profit
+                last_deal = self._last_deal()
+                print(f"Stop loss reached. ({last_deal.profit})\n")
+                if last_deal.symbol == self.symbol:
+                    self.balance += last_deal.profit
                 self.statistics()
 
+    def _last_deal(self):
+        """
+        Return the most recent deal of the last day.
+
+        The clock is read here, after the closing order was sent, so that the closing deal is
+        inside the requested range.
+
+        Returns:
+            Mt5.TradeDeal: The last deal.
+        """
+        now = datetime.now()
+        return Mt5.history_deals_get(now - timedelta(days=1), now)[-1]
+
     def days_end(self) -> bool:
         """
         Check if it is the end of trading for the day.
@@ -359,9 +412,7 @@ class Trade:
         Returns:
             bool: True if it is the end of trading for the day, False otherwise.
         """
-        if datetime.now().hour >= int(self.ending_time_hour) and datetime.now().minute >= int(self.ending_time_minutes):
-            return True
-        return False
+        return self._hour_minute() >= self._end_hm
 
     def trading_time(self) -> bool:
         """
@@ -370,12 +421,22 @@ class Trade:
         Returns:
             bool: True if it is within the allowed trading time, False otherwise.
         """
-        if int(self.start_time_hour) < datetime.now().hour < int(self.finishing_time_hour):
-            return True
-        elif datetime.now().hour == int(self.start_time_hour):
-            if datetime.now().minute >= int(self.start_time_minutes):
-                return True
-        elif datetime.now().hour == int(self.finishing_time_hour):
-            if datetime.now().minute < int(self.finishing_time_minutes):
-                return True
-        return False
+        return self._start_hm <= self._hour_minute() < self._finish_hm
+
+    def _hour_minute(self) -> int:
+        """
+        Return the local time as hour * 100 + minute.
+
+        The clock is read once per minute, the value is reused until the next minute starts.
+        Time zone offsets are whole minutes, so the local minute changes exactly when the epoch
+        minute does.
+
+        Returns:
+            int: The time as hour * 100 + minute.
+        """
+        timestamp = time.time()
+        minute = int(timestamp // 60)
+        if minute != self._clock_minute:
+            now = datetime.fromtimestamp(timestamp)
+            self._clock_minute, self._clock_hm = minute, now.hour * 100 + now.minute
+        return self._clock_hm